@@ -1,8 +1,13 @@
 import os
 
+# Built once at import time; the getters below hand back these shared objects
+_DATE_FORMATS = ('%Y-%m-%d', '%m/%d/%Y')
+_CSV_DELIMITER = ','
+_SUPPORTED_FILE_TYPES = frozenset({'.csv'})
+
 class AppConfig:
     """Application configuration class"""
-    DEBUG = True
+    DEBUG = os.getenv('DEBUG') == '1'
     SECRET_KEY = 'your-secret-key-here'
 
     # Template and static folder configuration
@@ -12,14 +17,14 @@ class AppConfig:
     @staticmethod
     def get_date_formats():
         """Supported date formats for parsing"""
-        return ['%Y-%m-%d', '%m/%d/%Y']
+        return _DATE_FORMATS
 
     @staticmethod
     def get_csv_delimiter():
         """CSV delimiter for parsing"""
-        return ','
+        return _CSV_DELIMITER
 
     @staticmethod
     def get_supported_file_types():
         """Supported file types for import"""
-        return ['.csv']
+        return _SUPPORTED_FILE_TYPES
@@ -1,9 +1,75 @@
+from collections.abc import Mapping
 from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+from jinja2 import FileSystemBytecodeCache
 from models import Account, Budget
 from services.transaction_service import TransactionService
 from repositories.transaction_repository import TransactionRepository
 from config.app_config import AppConfig
 
+try:
+    import orjson
+except ImportError:  # optional speedup, fall back to Flask's stdlib encoder
+    orjson = None
+
+class OrjsonJSONProvider(DefaultJSONProvider):
+    """JSON provider that serializes responses with orjson
+
+    Only ``dumps`` is replaced; request bodies are still parsed by the default
+    provider. Dates and dataclasses go through the default provider's
+    ``default`` hook, and anything orjson cannot lay out the same way (other
+    indents or separators, non-string keys, integers wider than 64 bits,
+    non-ASCII text while ``ensure_ascii`` is on) falls back to the stdlib
+    encoder. Floats can still differ: exponents are written as ``1e-7`` rather
+    than ``1e-07``, and NaN/Infinity become ``null`` instead of the stdlib's
+    non-standard ``NaN``/``Infinity`` tokens.
+    """
+
+    def dumps(self, obj, **kwargs):
+        indent = kwargs.get('indent')
+        compact = indent is None and kwargs.get('separators') == (',', ':')
+        if not (compact or indent == 2):
+            return super().dumps(obj, **kwargs)
+
+        option = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+        if indent == 2:
+            option |= orjson.OPT_INDENT_2
+        if kwargs.get('sort_keys', self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            result = orjson.dumps(obj, default=self.default, option=option).decode()
+        except TypeError:
+            return super().dumps(obj, **kwargs)
+        if kwargs.get('ensure_ascii', self.ensure_ascii) and not result.isascii():
+            return super().dumps(obj, **kwargs)
+        return result
+
+class AppComponents(Mapping):
+    """Container for the components built by AppFactory.create_full_app
+
+    Components are read as attributes (components.app); the read-only mapping
+    interface keeps dict-style callers (components['app'], **components) working.
+    """
+    __slots__ = ('app', 'account', 'budget', 'transaction_service', 'repository')
+
+    def __init__(self, app, account, budget, transaction_service, repository):
+        self.app = app
+        self.account = account
+        self.budget = budget
+        self.transaction_service = transaction_service
+        self.repository = repository
+
+    def __getitem__(self, name):
+        if name not in self.__slots__:
+            raise KeyError(name)
+        return getattr(self, name)
+
+    def __iter__(self):
+        return iter(self.__slots__)
+
+    def __len__(self):
+        return len(self.__slots__)
+
 class AppFactory:
     """Factory class for creating application components"""
 
@@ -16,27 +82,22 @@ class AppFactory:
             static_folder=AppConfig.STATIC_FOLDER
         )
         app.config.from_object(AppConfig)
+        if orjson is not None:
+            app.json = OrjsonJSONProvider(app)
+        if not app.debug:
+            # Jinja's default location is a per-user 0700 directory whose ownership it verifies
+            try:
+                app.jinja_env.bytecode_cache = FileSystemBytecodeCache()
+            except (OSError, RuntimeError):
+                # The cache only speeds up template loading; run without it
+                pass
         return app
 
-    @staticmethod
-    def create_account():
-        """Create an account instance"""
-        return Account()
-
-    @staticmethod
-    def create_budget():
-        """Create a budget instance"""
-        return Budget()
-
-    @staticmethod
-    def create_transaction_service(account, budget=None):
-        """Create a transaction service instance"""
-        return TransactionService(account, budget)
-
-    @staticmethod
-    def create_transaction_repository(account):
-        """Create a transaction repository instance"""
-        return TransactionRepository(account)
+    # Component constructors are bound directly so creation skips a wrapper frame
+    create_account = staticmethod(Account)
+    create_budget = staticmethod(Budget)
+    create_transaction_service = staticmethod(TransactionService)
+    create_transaction_repository = staticmethod(TransactionRepository)
 
     @staticmethod
     def create_full_app():
@@ -47,10 +108,10 @@ class AppFactory:
         transaction_service = AppFactory.create_transaction_service(account, budget)
         repository = AppFactory.create_transaction_repository(account)
 
-        return {
-            'app': app,
-            'account': account,
-            'budget': budget,
-            'transaction_service': transaction_service,
-            'repository': repository
-        }
+        return AppComponents(
+            app=app,
+            account=account,
+            budget=budget,
+            transaction_service=transaction_service,
+            repository=repository
+        )
@@ -59,4 +59,4 @@ class TransactionRepository:
 
     def exists(self, transaction_id: int) -> bool:
         """Check if a transaction exists"""
-        return self.find_by_id(transaction_id) is not None
+        return self.account.get_transaction_by_id(transaction_id) is not None
@@ -1,6 +1,38 @@
 import datetime
+import io
+import sys
+from collections import defaultdict
+from functools import lru_cache
 from models import Transaction, Account, Budget, InvalidTransactionError
 
+@lru_cache(maxsize=4096)
+def _month_bounds(year, month):
+    """Get the first day of a month and of the following month"""
+    start_month = datetime.date(year, month, 1)
+    end_month = datetime.date(year + month // 12, month % 12 + 1, 1)
+    return start_month, end_month
+
+# Shared by the single-value getters and get_monthly_summary so their results match
+def _spending(transactions):
+    """Total expenses as a positive number"""
+    # Negating the sum gives the same result as summing abs() values, without the per-row call
+    return -sum(t.amount for t in transactions if t.amount < 0)
+
+def _income(transactions):
+    """Total income"""
+    return sum(t.amount for t in transactions if t.amount > 0)
+
+def _category_totals(transactions):
+    """Net amount per category"""
+    category_totals = defaultdict(int)
+    for t in transactions:
+        category_totals[t.category] += t.amount
+    return dict(category_totals)
+
+def _category_spending(category_totals):
+    """Only categories with negative totals (expenses), as positive amounts"""
+    return {k: abs(v) for k, v in category_totals.items() if v < 0}
+
 class TransactionService:
     """Service class for handling transaction-related business logic"""
 
@@ -10,74 +42,60 @@ class TransactionService:
 
     def create_transaction(self, date, amount, category, description=""):
         """Create and save a new transaction"""
+        if type(category) is str:
+            category = sys.intern(category)
         transaction = Transaction(date, amount, category, description)
         self.account.add_transaction(transaction)
         return transaction
 
-    def get_monthly_spending(self, year=None, month=None):
-        """Calculate total spending for a specific month"""
+    def _get_monthly_transactions(self, year=None, month=None):
+        """Get the transactions for a month (defaults to current month)"""
         if year is None or month is None:
             today = datetime.date.today()
             year, month = today.year, today.month
 
-        start_month = datetime.date(year, month, 1)
-        if month == 12:
-            end_month = datetime.date(year + 1, 1, 1)
-        else:
-            end_month = datetime.date(year, month + 1, 1)
-
-        monthly_transactions = self.account.list_transactions(
+        start_month, end_month = _month_bounds(year, month)
+        return self.account.list_transactions(
             start_date=start_month,
             end_date=end_month
         )
-        return sum(abs(t.amount) for t in monthly_transactions if t.amount < 0)
 
-    def get_monthly_income(self, year=None, month=None):
-        """Calculate total income for a specific month"""
-        if year is None or month is None:
-            today = datetime.date.today()
-            year, month = today.year, today.month
+    def get_monthly_summary(self, year=None, month=None):
+        """Calculate spending, income and category figures for a month from one scan"""
+        monthly_transactions = self._get_monthly_transactions(year, month)
+        category_totals = _category_totals(monthly_transactions)
+        return {
+            'spending': _spending(monthly_transactions),
+            'income': _income(monthly_transactions),
+            'category_totals': category_totals,
+            'category_spending': _category_spending(category_totals)
+        }
 
-        start_month = datetime.date(year, month, 1)
-        if month == 12:
-            end_month = datetime.date(year + 1, 1, 1)
-        else:
-            end_month = datetime.date(year, month + 1, 1)
+    def get_monthly_spending(self, year=None, month=None):
+        """Calculate total spending for a specific month"""
+        return _spending(self._get_monthly_transactions(year, month))
 
-        monthly_transactions = self.account.list_transactions(
-            start_date=start_month,
-            end_date=end_month
-        )
-        return sum(t.amount for t in monthly_transactions if t.amount > 0)
+    def get_monthly_income(self, year=None, month=None):
+        """Calculate total income for a specific month"""
+        return _income(self._get_monthly_transactions(year, month))
 
     def get_category_totals(self, year=None, month=None):
         """Get spending totals by category for a specific month"""
-        if year is None or month is None:
-            today = datetime.date.today()
-            year, month = today.year, today.month
-
-        start_month = datetime.date(year, month, 1)
-        if month == 12:
-            end_month = datetime.date(year + 1, 1, 1)
-        else:
-            end_month = datetime.date(year, month + 1, 1)
-
-        monthly_transactions = self.account.list_transactions(
-            start_date=start_month,
-            end_date=end_month
-        )
-
-        category_totals = {}
-        for t in monthly_transactions:
-            category_totals[t.category] = category_totals.get(t.category, 0) + t.amount
-
-        return category_totals
+        return _category_totals(self._get_monthly_transactions(year, month))
 
     def get_category_spending(self, year=None, month=None):
         """Get spending amounts by category (positive values for pie chart)"""
-        category_totals = self.get_category_totals(year, month)
-        # Only include categories with negative amounts (expenses)
-        return {k: abs(v) for k, v in category_totals.items() if v < 0}
+        return _category_spending(self.get_category_totals(year, month))
+
+    def get_dashboard_summary(self):
+        """Get balance and current-month figures for the dashboard in one call"""
+        summary = self.get_monthly_summary()
+        return {
+            'balance': self.account.get_balance(),
+            'monthly_spending': summary['spending'],
+            'monthly_income': summary['income'],
+            'category_totals': summary['category_totals']
+        }
 
     def get_balance(self):
         """Get current account balance"""
@@ -96,20 +114,41 @@ class TransactionService:
         self.account.delete_transaction(transaction_id)
 
     def import_transactions_from_csv(self, csv_content):
-        """Import multiple transactions from CSV content"""
+        """Import multiple transactions from CSV content (a string or a text stream)"""
+        if isinstance(csv_content, str):
+            # Universal newlines, so \r and \r\n endings split the same as \n
+            csv_content = io.StringIO(csv_content, newline=None)
+        return self.import_transactions_from_csv_stream(csv_content)
+
+    def import_transactions_from_csv_stream(self, stream):
+        """Import transactions from a text stream, one line at a time"""
         from utils import parse_csv_line
 
-        lines = csv_content.strip().splitlines()
         imported = 0
         errors = []
 
-        for i, line in enumerate(lines):
+        line_number = 0
+        lines = iter(stream)
+        while True:
+            try:
+                line = next(lines)
+            except StopIteration:
+                break
+            except UnicodeDecodeError as e:
+                # Text streams decode in buffered chunks, so nothing past this point was read
+                errors.append(f"Line {line_number + 1}: {e}; remaining lines were not imported")
+                break
+            line_number += 1
+
+            line = line.rstrip('\r\n')
+            if not line.strip():
+                continue
             try:
                 date, amount, category, description = parse_csv_line(line)
                 self.create_transaction(date, amount, category, description)
                 imported += 1
             except Exception as e:
-                errors.append(f"Line {i+1}: {e}")
+                errors.append(f"Line {line_number}: {e}")
 
         return imported, errors
 
@@ -118,12 +157,25 @@ class TransactionService:
         if not self.budget:
             return None
 
-        spent = abs(self.get_category_totals().get(category, 0))
-        budget_amount = self.budget.get_budget(category)
-        remaining = budget_amount - spent
+        return self.get_budget_statuses([category])[category]
 
-        return {
-            'budget': budget_amount,
-            'spent': spent,
-            'remaining': remaining
-        }
+    def get_budget_statuses(self, categories=None):
+        """Get budget status for several categories from a single month scan"""
+        if not self.budget:
+            return None
+
+        if categories is None:
+            categories = self.budget.monthly_budgets
+        category_totals = self.get_category_totals()
+
+        statuses = {}
+        for category in categories:
+            spent = abs(category_totals.get(category, 0))
+            budget_amount = self.budget.get_budget(category)
+            statuses[category] = {
+                'budget': budget_amount,
+                'spent': spent,
+                'remaining': budget_amount - spent
+            }
+
+        return statuses
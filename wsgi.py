@@ -0,0 +1,10 @@
+"""WSGI entry point for production servers, e.g.
+
+    gunicorn -w 1 --threads 4 wsgi:application
+
+Transactions are held in memory by each process, so run a single worker
+and scale with threads. Imports the Flask app from app.py.
+"""
+from app import app
+
+application = app